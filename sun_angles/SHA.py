@@ -1,62 +1,108 @@
-import warnings
+from typing import Optional
+
 import numpy as np
 
-from .day_angle import day_angle_rad_from_DOY
-from .declination import solar_dec_deg_from_day_angle_rad
+from ._constants import DEG_TO_RAD, RAD_TO_DEG
+from ._dispatch import astype_floating, floating_dtype, get_array_module, is_scalar
+from ._numba_kernels import NUMBA_AVAILABLE, use_numba
+from ._numexpr_kernels import NUMEXPR_AVAILABLE, use_numexpr
+from ._scalar import _SHA_deg_scalar
+from .declination import _solar_dec_rad_from_DOY
+
+if NUMBA_AVAILABLE:
+    from ._numba_kernels import _sha_kernel, run_kernel
+
+if NUMEXPR_AVAILABLE:
+    from ._numexpr_kernels import _SHA_deg_numexpr
 
-def SHA_deg_from_DOY_lat(DOY: np.ndarray, latitude: np.ndarray) -> np.ndarray:
+__all__ = ["SHA_deg_from_DOY_lat"]
+
+def SHA_deg_from_DOY_lat(
+        DOY: np.ndarray,
+        latitude: np.ndarray,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Calculate the sunrise hour angle in degrees from the latitude in degrees and the day of the year.
 
     Parameters:
     DOY (np.ndarray): A numpy array containing day of the year values (integers between 1 and 365).
     latitude (np.ndarray): A numpy array containing latitude values in degrees.
+    dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 for float32 latitude and float64 otherwise.
+    out (np.ndarray, optional): Array to write the result into, with the broadcast shape of the inputs.
 
     Returns:
     np.ndarray: A numpy array containing the corresponding sunrise hour angles in degrees.
 
     The function performs the following steps:
     1. Calculate the day angle in radians from the day of the year using the function `day_angle_rad_from_DOY`.
-    2. Calculate the solar declination in degrees from the day angle in radians using the function `solar_dec_deg_from_day_angle_rad`.
-    3. Convert latitude and solar declination from degrees to radians.
+    2. Calculate the solar declination in radians from the day angle in radians,
+       or look it up in a precomputed table for integer days of the year.
+    3. Convert latitude from degrees to radians.
     4. Calculate the cosine of the sunrise hour angle using the formula:
        sunrise_cos = -tan(latitude_rad) * tan(solar_dec_rad)
-    5. Calculate the sunrise hour angle in radians using the arccosine of the sunrise_cos.
-    6. Convert the sunrise hour angle from radians to degrees.
-    7. Apply polar correction to handle extreme values of the cosine.
+    5. Apply polar correction by clipping sunrise_cos to [-1, 1], so that polar night yields 0 degrees
+       and midnight sun yields 180 degrees.
+    6. Calculate the sunrise hour angle in radians using the arccosine of the sunrise_cos.
+    7. Convert the sunrise hour angle from radians to degrees.
 
     The sunrise hour angle represents the angle between the local meridian and the hour circle of the sunrise point.
 
     References:
     Duffie, J. A., & Beckman, W. A. (2013). Solar Engineering of Thermal Processes (4th ed.). Wiley.
     """
-    # calculate day angle in radians
-    day_angle_rad = day_angle_rad_from_DOY(DOY)
+    # evaluate scalars with the `math` module to avoid ufunc dispatch overhead
+    if out is None and is_scalar(DOY, latitude):
+        return _SHA_deg_scalar(DOY, latitude)
 
-    # calculate solar declination in degrees
-    solar_dec_deg = solar_dec_deg_from_day_angle_rad(day_angle_rad)
+    # preserve float32 latitude instead of promoting it to float64, regardless of the integer day of year
+    if dtype is None:
+        dtype = floating_dtype(latitude) if out is None else out.dtype
 
-    # convert latitude to radians
-    latitude_rad = np.radians(latitude)
+    latitude = astype_floating(latitude, dtype)
 
-    # convert solar declination to radians
-    solar_dec_rad = np.radians(solar_dec_deg)
+    # calculate the solar declination in radians once at the shape of the day of year, which is usually a scalar,
+    # looking it up for integer days of the year instead of evaluating the series
+    solar_dec_rad = _solar_dec_rad_from_DOY(DOY, dtype)
 
-    # calculate cosine of sunrise angle at latitude and solar declination
-    # need to keep the cosine for polar correction
-    sunrise_cos = -np.tan(latitude_rad) * np.tan(solar_dec_rad)
+    # get the array namespace of the inputs, which runs the remaining steps on the GPU for CuPy arrays
+    xp = get_array_module(solar_dec_rad, latitude)
 
-    # calculate sunrise angle in radians from cosine
-    with warnings.catch_warnings():
-        warnings.filterwarnings('ignore')
-        sunrise_rad = np.arccos(sunrise_cos)
+    # the tangent of the declination likewise only needs to be evaluated at the shape of the day of year
+    tan_dec = xp.tan(solar_dec_rad)
 
-    # convert to degrees
-    sunrise_deg = np.degrees(sunrise_rad)
+    # when the day of year has the full shape of latitude, fuse the remaining steps into a single pass,
+    # otherwise the vectorized tangent of latitude below is the only full-size sweep and is faster on its own
+    fused = np.ndim(tan_dec) >= np.ndim(latitude)
 
-    # apply polar correction
-    sunrise_deg = np.where(sunrise_cos >= 1, 0, sunrise_deg)
-    sunrise_deg = np.where(sunrise_cos <= -1, 180, sunrise_deg)
+    # when Numba is installed and enough threads share the loop, compute NumPy arrays and scalars in a single pass without temporaries
+    if fused and use_numba(dtype, tan_dec, latitude, min_threads=4):
+        return run_kernel(_sha_kernel, tan_dec, latitude, dtype=dtype, out=out)
+
+    # otherwise when numexpr is installed and enough threads share the blocks, evaluate the formula in blocked passes without the intermediate sweeps
+    if fused and use_numexpr(dtype, tan_dec, latitude, min_threads=4):
+        return _SHA_deg_numexpr(tan_dec, latitude, dtype, out)
+
+    # convert latitude to radians
+    latitude_rad = latitude * DEG_TO_RAD
+
+    # calculate cosine of sunrise angle at latitude and solar declination
+    sunrise_cos = -xp.tan(latitude_rad) * tan_dec
+
+    # apply polar correction by clipping the cosine to the domain of the arccosine,
+    # since arccos(1) = 0 degrees and arccos(-1) = 180 degrees are exactly the polar boundaries
+    if isinstance(sunrise_cos, xp.ndarray):
+        # reuse the cosine buffer for the sunrise angle on plain arrays, unless an output was given
+        sunrise_deg = xp.clip(sunrise_cos, -1.0, 1.0, out=sunrise_cos if out is None else out)
+        xp.arccos(sunrise_deg, out=sunrise_deg)
+        xp.multiply(sunrise_deg, RAD_TO_DEG, out=sunrise_deg)
+    else:
+        sunrise_deg = xp.arccos(xp.clip(sunrise_cos, -1.0, 1.0)) * RAD_TO_DEG
+
+        # scalars and Rasters cannot be computed in place, so copy the result into the output afterwards
+        if out is not None:
+            out[...] = sunrise_deg
+            sunrise_deg = out
 
     return sunrise_deg
 
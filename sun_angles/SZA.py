@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Optional, Union
 from datetime import datetime
 
 import numpy as np
@@ -6,13 +6,58 @@ from rasters import Raster
 
 from solar_apparent_time import solar_day_of_year_for_longitude
 
-from .day_angle import day_angle_rad_from_DOY
-from .declination import solar_dec_deg_from_day_angle_rad
+from ._constants import DEG_TO_RAD, RAD_TO_DEG
+from ._dispatch import astype_floating, floating_dtype, get_array_module, is_scalar
+from ._numba_kernels import NUMBA_AVAILABLE, use_numba
+from ._numexpr_kernels import NUMEXPR_AVAILABLE, use_numexpr
+from ._scalar import _SZA_deg_scalar, _SZA_deg_from_DOY_scalar
+from ._sincos import sincos
+from .declination import _solar_dec_rad_from_DOY
+from .hour_angle import hour_angle_rad_from_hour
+
+if NUMBA_AVAILABLE:
+    from ._numba_kernels import _sza_kernel, run_kernel
+
+if NUMEXPR_AVAILABLE:
+    from ._numexpr_kernels import _SZA_deg_numexpr
+
+__all__ = ["SZA_deg_from_lat_dec_hour", "calculate_SZA_from_DOY_and_hour", "calculate_SZA_from_datetime"]
+
+def _SZA_rad_from_lat_dec_rad_hour_rad(
+        latitude_rad: Union[Raster, np.ndarray],
+        solar_dec_rad: Union[Raster, np.ndarray],
+        hour_angle_rad: Union[Raster, np.ndarray],
+        out: Optional[np.ndarray] = None) -> Union[Raster, np.ndarray]:
+    """
+    Calculate the solar zenith angle in radians from latitude, solar declination, and hour angle in radians,
+    optionally writing the result into `out`.
+    """
+    xp = get_array_module(latitude_rad, solar_dec_rad, hour_angle_rad)
+    sin_lat, cos_lat = sincos(latitude_rad)
+    sin_dec, cos_dec = sincos(solar_dec_rad)
+
+    return xp.arccos(sin_lat * sin_dec + cos_lat * cos_dec * xp.cos(hour_angle_rad), out=out)
+
+def _SZA_deg_kernel(
+        latitude: np.ndarray,
+        solar_dec_rad: np.ndarray,
+        hour_angle_rad: np.ndarray,
+        dtype: np.dtype,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate the solar zenith angle in degrees in a single compiled loop, evaluating the sine and cosine
+    of the declination and the cosine of the hour angle at their own shapes instead of once per pixel.
+    """
+    sin_dec, cos_dec = sincos(solar_dec_rad)
+
+    return run_kernel(_sza_kernel, latitude, sin_dec, cos_dec, np.cos(hour_angle_rad), dtype=dtype, out=out)
 
 def SZA_deg_from_lat_dec_hour(
         latitude: np.ndarray, 
         solar_dec_deg: Union[Raster, np.ndarray], 
-        hour: Union[Raster, np.ndarray]) -> np.ndarray:
+        hour: Union[Raster, np.ndarray],
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     This function calculates the solar zenith angle (SZA) given the latitude, solar declination, and solar time. 
     The SZA is the angle between the zenith and the center of the sun's disc. The zenith is the point on the celestial 
@@ -28,6 +73,8 @@ def SZA_deg_from_lat_dec_hour(
     :param latitude: Latitude of the location in degrees. Ranges from -90 (South Pole) to 90 (North Pole).
     :param solar_dec_deg: Solar declination in degrees. It is the tilt of the Earth's axis relative to the sun and varies throughout the year.
     :param hour: Solar time in hours. It is the time based on the position of the sun in the sky, and varies throughout the day from 0 to 24.
+    :param dtype: Floating point dtype to compute in. Defaults to float32 when the array inputs are float32 and float64 otherwise.
+    :param out: Array to write the result into, with the broadcast shape of the inputs.
 
     Returns:
     :return: Solar zenith angle in degrees. Ranges from 0 (sun directly overhead) to 90 (sun on the horizon).
@@ -35,24 +82,39 @@ def SZA_deg_from_lat_dec_hour(
     References:
     Muneer, T., & Fairooz, F. (2005). Solar radiation model. Applied energy, 81(4), 419-437.
     """
-    # Convert latitude from degrees to radians for computation
-    latitude_rad = np.radians(latitude)
+    # evaluate scalars with the `math` module to avoid ufunc dispatch overhead
+    if out is None and is_scalar(latitude, solar_dec_deg, hour):
+        return _SZA_deg_scalar(latitude, solar_dec_deg, hour)
 
-    # Convert solar declination from degrees to radians for computation
-    solar_dec_rad = np.radians(solar_dec_deg)
+    # preserve float32 inputs instead of promoting them to float64
+    if dtype is None:
+        dtype = floating_dtype(latitude, solar_dec_deg, hour) if out is None else out.dtype
 
-    # Calculate the hour angle in degrees. The hour angle is the angular distance between the sun and the meridian plane.
-    # It is positive before noon and negative after noon. The formula used here converts solar time to hour angle.
-    hour_angle_deg = hour * 15.0 - 180.0
+    latitude = astype_floating(latitude, dtype)
+    solar_dec_deg = astype_floating(solar_dec_deg, dtype)
+    hour = astype_floating(hour, dtype)
 
-    # Convert the hour angle from degrees to radians for computation
-    hour_angle_rad = np.radians(hour_angle_deg)
+    # when Numba is installed and enough threads share the loop, compute NumPy arrays in a single compiled loop
+    if use_numba(dtype, latitude, solar_dec_deg, hour, min_threads=2):
+        return _SZA_deg_kernel(latitude, solar_dec_deg * DEG_TO_RAD, hour_angle_rad_from_hour(hour), dtype, out)
 
-    # Calculate the solar zenith angle in radians using the formula:
-    SZA_rad = np.arccos(np.sin(latitude_rad) * np.sin(solar_dec_rad) + np.cos(latitude_rad) * np.cos(solar_dec_rad) * np.cos(hour_angle_rad))
+    # otherwise when numexpr is installed and enough threads share the blocks, evaluate the whole formula in a single blocked pass
+    if use_numexpr(dtype, latitude, solar_dec_deg, hour, min_threads=3):
+        return _SZA_deg_numexpr(latitude, solar_dec_deg, hour, dtype, out)
 
-    # Convert the solar zenith angle from radians to degrees for the final output
-    SZA_deg = np.degrees(SZA_rad)
+    # Convert latitude from degrees to radians for computation
+    latitude_rad = latitude * DEG_TO_RAD
+
+    # Convert solar declination from degrees to radians for computation
+    solar_dec_rad = solar_dec_deg * DEG_TO_RAD
+
+    # Calculate the hour angle in radians. The hour angle is the angular distance between the sun and the meridian plane.
+    # The solar time is converted to hour * 15 - 180 degrees and then to radians in a single multiply-subtract.
+    hour_angle_rad = hour_angle_rad_from_hour(hour)
+
+    # Calculate the solar zenith angle in radians and convert it to degrees in place for the final output
+    SZA_deg = _SZA_rad_from_lat_dec_rad_hour_rad(latitude_rad, solar_dec_rad, hour_angle_rad, out=out)
+    SZA_deg *= RAD_TO_DEG
 
     # Return the solar zenith angle in degrees
     return SZA_deg
@@ -61,7 +123,9 @@ def calculate_SZA_from_DOY_and_hour(
         lat: Union[float, np.ndarray], 
         lon: Union[float, np.ndarray], 
         DOY: Union[float, np.ndarray, Raster], 
-        hour: Union[float, np.ndarray, Raster]) -> Union[float, np.ndarray, Raster]:
+        hour: Union[float, np.ndarray, Raster],
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> Union[float, np.ndarray, Raster]:
     """
     Calculates the solar zenith angle (SZA) in degrees based on the given UTC time, latitude, longitude, day of year, and hour of day.
 
@@ -70,13 +134,35 @@ def calculate_SZA_from_DOY_and_hour(
         lon (Union[float, np.ndarray]): The longitude in degrees.
         doy (Union[float, np.ndarray, Raster]): The day of year.
         hour (Union[float, np.ndarray, Raster]): The hour of the day.
+        dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 when latitude and hour are float32 and float64 otherwise.
+        out (np.ndarray, optional): Array to write the result into, with the broadcast shape of the inputs.
 
     Returns:
         Union[float, np.ndarray, Raster]: The calculated solar zenith angle in degrees.
     """
-    day_angle_rad = day_angle_rad_from_DOY(DOY)
-    solar_dec_deg = solar_dec_deg_from_day_angle_rad(day_angle_rad)
-    SZA = SZA_deg_from_lat_dec_hour(lat, solar_dec_deg, hour)
+    # evaluate scalars with the `math` module to avoid ufunc dispatch overhead
+    if out is None and is_scalar(lat, DOY, hour):
+        return _SZA_deg_from_DOY_scalar(lat, DOY, hour)
+
+    # preserve float32 inputs instead of promoting them to float64
+    if dtype is None:
+        dtype = floating_dtype(lat, hour) if out is None else out.dtype
+
+    lat = astype_floating(lat, dtype)
+    hour = astype_floating(hour, dtype)
+
+    # stay in radians between the declination and the zenith angle instead of round-tripping through degrees,
+    # looking up the declination of integer days of year or evaluating it once per distinct day of year
+    solar_dec_rad = _solar_dec_rad_from_DOY(DOY, dtype)
+    hour_angle_rad = hour_angle_rad_from_hour(hour)
+
+    # when Numba is installed and enough threads share the loop, compute the zenith angle of NumPy arrays in a single compiled loop
+    if use_numba(dtype, lat, solar_dec_rad, hour_angle_rad, min_threads=2):
+        return _SZA_deg_kernel(lat, solar_dec_rad, hour_angle_rad, dtype, out)
+
+    # otherwise calculate the solar zenith angle in radians from latitude in radians and convert it to degrees in place
+    SZA = _SZA_rad_from_lat_dec_rad_hour_rad(lat * DEG_TO_RAD, solar_dec_rad, hour_angle_rad, out=out)
+    SZA *= RAD_TO_DEG
 
     return SZA
 
@@ -94,9 +180,8 @@ def calculate_SZA_from_datetime(time_UTC: datetime, lat: float, lon: float):
     """
     # Calculate the day of year based on the UTC time and longitude
     doy = solar_day_of_year_for_longitude(time_UTC, lon)
-    # Calculate the hour of the day based on the UTC time and longitude
-    # FIXME missing `hour_of_day` implementation
-    hour = hour_of_day(time_UTC, lon)
+    # Calculate the solar hour of the day from the UTC time of day, shifted by 15 degrees of longitude per hour
+    hour = (time_UTC.hour + time_UTC.minute / 60.0 + time_UTC.second / 3600.0 + lon / 15.0) % 24.0
     # Calculate the solar zenith angle in degrees based on the latitude, solar declination angle, and hour of the day
     SZA = calculate_SZA_from_DOY_and_hour(lat, lon, doy, hour)
 
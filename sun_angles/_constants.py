@@ -0,0 +1,33 @@
+import numpy as np
+
+# conversion factors folded into the surrounding arithmetic instead of calling `np.radians` and `np.degrees`
+DEG_TO_RAD = np.pi / 180.0
+RAD_TO_DEG = 180.0 / np.pi
+
+# the hour angle in radians is hour * 15 degrees per hour - 180 degrees, folded into a single multiply-subtract
+HOUR_TO_RAD = 15.0 * DEG_TO_RAD
+
+# the day angle in radians is (DOY - 1) * 2 pi / 365, folded into a single multiply-subtract of DOY * DAY_TO_RAD - DAY_TO_RAD.
+# The year length stays at 365 days because the declination coefficients below were fitted to this day angle.
+DAY_TO_RAD = 2.0 * np.pi / 365.0
+
+# Fourier series coefficients of the solar declination in radians, ordered as
+# constant, cos(x), sin(x), cos(2x), sin(2x), cos(3x), sin(3x)
+DEC_COEFFICIENTS_RAD = (0.006918, -0.399912, 0.070257, -0.006758, 0.000907, -0.002697, 0.00148)
+
+def _dec_polynomial(coefficients: tuple) -> tuple:
+    """
+    Rewrite the declination Fourier series as the polynomial
+    A0 + A1 c + A2 c^2 + A3 c^3 + s (B0 + B1 c + B2 c^2) in the cosine `c` and sine `s` of the day angle,
+    using cos(2x) = 2c^2 - 1, cos(3x) = 4c^3 - 3c, sin(2x) = 2sc, and sin(3x) = s (4c^2 - 1),
+    so that it evaluates with Horner's rule in fused multiply-adds.
+    """
+    a0, a1, b1, a2, b2, a3, b3 = coefficients
+
+    return (a0 - a2, a1 - 3.0 * a3, 2.0 * a2, 4.0 * a3, b1 - b3, 2.0 * b2, 4.0 * b3)
+
+# polynomial coefficients of the solar declination in radians, ordered as A0, A1, A2, A3, B0, B1, B2
+DEC_POLYNOMIAL_RAD = _dec_polynomial(DEC_COEFFICIENTS_RAD)
+
+# the same coefficients premultiplied by 180 / pi so the polynomial evaluates directly in degrees
+DEC_POLYNOMIAL_DEG = tuple(coefficient * RAD_TO_DEG for coefficient in DEC_POLYNOMIAL_RAD)
@@ -0,0 +1,80 @@
+from numbers import Real
+
+import numpy as np
+
+try:
+    import cupy
+    CUPY_AVAILABLE = True
+except ImportError:
+    cupy = None
+    CUPY_AVAILABLE = False
+
+def get_array_module(*values):
+    """
+    Get the array namespace for the given values, which is `cupy` for CuPy arrays on the GPU
+    and `numpy` for everything else, so that a single code path runs on either device.
+    """
+    if CUPY_AVAILABLE:
+        return cupy.get_array_module(*values)
+
+    return np
+
+def is_ndarray_or_scalar(*values) -> bool:
+    """
+    Check whether every value is a NumPy array or a real scalar, as opposed to a Raster,
+    so that it can be handed to the compiled kernels which only understand plain arrays.
+    """
+    return all(isinstance(value, (np.ndarray, Real)) for value in values)
+
+def is_scalar(*values) -> bool:
+    """
+    Check whether every value is a real scalar, which can be computed with the `math` module
+    without paying the NumPy ufunc dispatch overhead.
+    Python floats and ints are recognized by their exact type first, since the `numbers.Real`
+    check goes through the abstract base class machinery and costs several times the formula itself.
+    """
+    for value in values:
+        if type(value) is not float and type(value) is not int and not isinstance(value, Real):
+            return False
+
+    return True
+
+def floating_dtype(*values) -> np.dtype:
+    """
+    Get the floating point dtype to compute in, which is float32 when the array inputs are all float32
+    and float64 when any of them is float64 or an integer array, or when there are no array inputs at all.
+    Python scalars do not affect the result, and array-likes such as lists count with the dtype NumPy gives them.
+    """
+    dtypes = [value.dtype if hasattr(value, "dtype") else np.asarray(value).dtype for value in values if not isinstance(value, Real)]
+
+    if not dtypes:
+        return np.dtype(np.float64)
+
+    return np.result_type(*dtypes, np.float32)
+
+def astype_floating(value, dtype: np.dtype):
+    """
+    Cast an array or Raster to the given floating point dtype, leaving arrays that already have that dtype untouched.
+
+    Scalars become NumPy scalars of the dtype, so that the NumPy scalar results of ufuncs on them,
+    such as the sine of a Python float declination, do not promote float32 arrays to float64,
+    and numexpr does not evaluate them as double precision.
+
+    NumPy arrays whose last axis is strided, such as slices of a larger raster, are also copied
+    into contiguous memory, because the SIMD `sin` and `cos` loops of NumPy only run on unit strides.
+    Broadcast views with a zero stride are left as they are rather than expanded to their full size.
+    Array-likes without a dtype, such as lists, are converted to NumPy arrays.
+    """
+    if isinstance(value, Real):
+        return dtype.type(value)
+
+    if not hasattr(value, "dtype"):
+        return np.asarray(value, dtype=dtype)
+
+    if isinstance(value, np.ndarray) and value.ndim > 0 and value.strides[-1] not in (0, value.itemsize):
+        return np.ascontiguousarray(value, dtype=dtype)
+
+    if value.dtype == dtype:
+        return value
+
+    return value.astype(dtype)
@@ -0,0 +1,209 @@
+"""
+Optional Numba kernels for the element-wise solar angle pipelines.
+
+Each kernel fuses a whole formula into a single parallel loop over flat arrays,
+keeping every intermediate value in a scalar local instead of a full-size temporary array.
+Terms that only depend on the declination or the hour angle, which are usually a scalar or a time vector,
+are evaluated by the caller at their own shape and passed in, so the kernels do not repeat them for every pixel.
+Numba is not a hard dependency of this package. When it cannot be imported,
+`NUMBA_AVAILABLE` is False and the public functions fall back to their NumPy implementations.
+The public functions also fall back to NumPy whenever `use_numba` does not expect a kernel to be faster,
+since the SIMD ufunc loops of NumPy outrun a single-threaded kernel on most of these formulas,
+and on every float32 one.
+"""
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from ._constants import DEG_TO_RAD, RAD_TO_DEG
+from ._dispatch import is_ndarray_or_scalar
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    numba = None
+    NUMBA_AVAILABLE = False
+
+# fast-math flags without `nnan` and `ninf` so that NaN no-data pixels still propagate
+FASTMATH_FLAGS = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# smallest input for which a compiled loop beats the NumPy ufuncs, below which the call overhead dominates
+NUMBA_MIN_SIZE = 2048
+
+def use_numba(dtype: np.dtype, *values, min_threads: int = 2) -> bool:
+    """
+    Check whether a Numba kernel is expected to be faster than the NumPy implementation for these inputs.
+    The kernels are only used for float64 NumPy arrays and scalars with at least `NUMBA_MIN_SIZE` elements,
+    when Numba runs at least `min_threads` threads. Each caller passes the thread count at which its kernel
+    was measured to overtake NumPy, which is a single thread only for formulas that NumPy evaluates in
+    several full-size sweeps, such as the declination series.
+    """
+    if not NUMBA_AVAILABLE or np.dtype(dtype) != np.float64 or not is_ndarray_or_scalar(*values):
+        return False
+
+    if max(np.size(value) for value in values) < NUMBA_MIN_SIZE:
+        return False
+
+    return numba.get_num_threads() >= min_threads
+
+def broadcast_flat(*args, dtype: np.dtype) -> Tuple[Tuple[int, ...], List[np.ndarray]]:
+    """
+    Broadcast the inputs against each other once and return the broadcast shape along with a flat view
+    of every input at the broadcast size, which is the layout the element-wise kernels loop over.
+    Inputs that already have the broadcast shape are passed as flat contiguous views, and scalars and other
+    single-element inputs as zero-stride views, so neither is copied. Only lower-rank inputs with more than
+    one element, such as a time vector against a raster, are expanded into a full-size copy.
+    """
+    args = [np.asarray(arg, dtype=dtype) for arg in args]
+    shape = np.broadcast_shapes(*(arg.shape for arg in args))
+    size = math.prod(shape)
+    flat_args = []
+
+    for arg in args:
+        if arg.shape == shape:
+            flat_args.append(np.ascontiguousarray(arg).ravel())
+        elif arg.size == 1:
+            flat_args.append(np.broadcast_to(arg.reshape(1), (size,)))
+        else:
+            flat_args.append(np.ascontiguousarray(np.broadcast_to(arg, shape)).ravel())
+
+    return shape, flat_args
+
+def run_kernel(kernel, *args, dtype: np.dtype, out: Optional[np.ndarray] = None, constants: Tuple[float, ...] = ()) -> np.ndarray:
+    """
+    Broadcast the inputs against each other, run an element-wise kernel over their flat, contiguous views,
+    and return the result with the broadcast shape.
+    The kernel writes directly into `out` when it is a matching C-contiguous array.
+    Constants, such as polynomial coefficients, are passed to the kernel after the output without broadcasting.
+    """
+    shape, args = broadcast_flat(*args, dtype=dtype)
+
+    if out is not None and out.shape == shape and out.dtype == dtype and out.flags.c_contiguous:
+        result = out
+    else:
+        result = np.empty(shape, dtype=dtype)
+
+    kernel(*args, result.ravel(), *constants)
+
+    if out is not None and result is not out:
+        out[...] = result
+        result = out
+
+    return result
+
+if NUMBA_AVAILABLE:
+    @numba.njit(fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _solar_dec(day_angle_rad, coefficients):
+        """
+        Calculate the solar declination from the day angle in radians, in whichever angular unit
+        the coefficients are expressed in, evaluating the series as a polynomial in a single sine and cosine
+        with Horner's rule.
+        """
+        A0, A1, A2, A3, B0, B1, B2 = coefficients
+
+        s = math.sin(day_angle_rad)
+        c = math.cos(day_angle_rad)
+
+        return ((A3 * c + A2) * c + A1) * c + A0 + s * ((B2 * c + B1) * c + B0)
+
+    @numba.njit(parallel=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _solar_dec_kernel(day_angle_rad, out, A0, A1, A2, A3, B0, B1, B2):
+        """
+        Calculate the solar declination from a flat array of day angles in radians with the given coefficients.
+        """
+        coefficients = (A0, A1, A2, A3, B0, B1, B2)
+
+        for i in numba.prange(day_angle_rad.shape[0]):
+            out[i] = _solar_dec(day_angle_rad[i], coefficients)
+
+    @numba.njit(parallel=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _sha_kernel(tan_dec, lat, out):
+        """
+        Calculate the sunrise hour angle in degrees in a single pass over flat arrays of the tangent
+        of the solar declination and latitude in degrees, writing the result into `out`.
+        """
+        for i in numba.prange(lat.shape[0]):
+            # cosine of sunrise angle with polar correction
+            sunrise_cos = -math.tan(lat[i] * DEG_TO_RAD) * tan_dec[i]
+
+            if sunrise_cos >= 1.0:
+                out[i] = 0.0
+            elif sunrise_cos <= -1.0:
+                out[i] = 180.0
+            else:
+                out[i] = math.acos(sunrise_cos) * RAD_TO_DEG
+
+    @numba.njit(parallel=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _sza_kernel(lat, sin_dec, cos_dec, cos_hour_angle, out):
+        """
+        Calculate the solar zenith angle in degrees from flat arrays of latitude in degrees
+        and the sine and cosine of the solar declination and cosine of the hour angle.
+        """
+        for i in numba.prange(lat.shape[0]):
+            lat_rad = lat[i] * DEG_TO_RAD
+            out[i] = math.acos(math.sin(lat_rad) * sin_dec[i] + math.cos(lat_rad) * cos_dec[i] * cos_hour_angle[i]) * RAD_TO_DEG
+
+    @numba.njit(parallel=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _azimuth_kernel(cos_dec, sin_hour_angle, SZA, out):
+        """
+        Calculate the solar azimuth in degrees from flat arrays of the cosine of the solar declination,
+        the sine of the hour angle, and the solar zenith angle in degrees.
+        """
+        for i in numba.prange(SZA.shape[0]):
+            out[i] = math.asin(-sin_hour_angle[i] * cos_dec[i] / math.sin(SZA[i] * DEG_TO_RAD)) * RAD_TO_DEG
+
+    @numba.njit(parallel=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _azimuth_from_lat_kernel(lat, sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, out):
+        """
+        Calculate the quadrant-safe solar azimuth in degrees from flat arrays of latitude in degrees
+        and the sines and cosines of the solar declination and hour angle.
+        """
+        for i in numba.prange(lat.shape[0]):
+            lat_rad = lat[i] * DEG_TO_RAD
+            out[i] = math.atan2(
+                -sin_hour_angle[i] * cos_dec[i],
+                cos_hour_angle[i] * cos_dec[i] * math.sin(lat_rad) - sin_dec[i] * math.cos(lat_rad)
+            ) * RAD_TO_DEG
+
+    @numba.njit(parallel=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _solar_angles_kernel(lat, sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, SZA_out, SHA_out, azimuth_out, sunrise_out, daylight_out):
+        """
+        Calculate the solar zenith angle, sunrise hour angle, and solar azimuth in degrees, the sunrise hour,
+        and the daylight hours in a single pass over flat arrays of latitude in degrees and the sines and cosines
+        of the declination and hour angle, evaluating the sine and cosine of latitude only once.
+        """
+        for i in numba.prange(lat.shape[0]):
+            lat_rad = lat[i] * DEG_TO_RAD
+            sin_lat = math.sin(lat_rad)
+            cos_lat = math.cos(lat_rad)
+            sin_lat_sin_dec = sin_lat * sin_dec[i]
+            cos_lat_cos_dec = cos_lat * cos_dec[i]
+
+            SZA_out[i] = math.acos(sin_lat_sin_dec + cos_lat_cos_dec * cos_hour_angle[i]) * RAD_TO_DEG
+
+            # cosine of sunrise angle, which is -tan(lat) * tan(dec), with polar correction
+            sunrise_cos = -sin_lat_sin_dec / cos_lat_cos_dec
+
+            if sunrise_cos >= 1.0:
+                SHA_deg = 0.0
+            elif sunrise_cos <= -1.0:
+                SHA_deg = 180.0
+            else:
+                SHA_deg = math.acos(sunrise_cos) * RAD_TO_DEG
+
+            SHA_out[i] = SHA_deg
+            azimuth_out[i] = math.atan2(-sin_hour_angle[i] * cos_dec[i], cos_hour_angle[i] * cos_dec[i] * sin_lat - sin_dec[i] * cos_lat) * RAD_TO_DEG
+            sunrise_out[i] = 12.0 - SHA_deg / 15.0
+            daylight_out[i] = SHA_deg * (2.0 / 15.0)
+
+    @numba.njit(parallel=True, fastmath=FASTMATH_FLAGS, error_model="numpy", cache=True)
+    def _sincos_kernel(x, sin_out, cos_out):
+        """
+        Calculate the sine and cosine of a flat, contiguous array of angles in radians in a single pass,
+        reading each angle from memory once for both outputs.
+        """
+        for i in numba.prange(x.shape[0]):
+            sin_out[i] = math.sin(x[i])
+            cos_out[i] = math.cos(x[i])
@@ -0,0 +1,126 @@
+"""
+Optional numexpr expressions for the element-wise solar angle formulas.
+
+numexpr evaluates each formula in a single pass over cache-sized blocks using multiple threads,
+without materializing a full-size temporary for every intermediate operation.
+numexpr is not a hard dependency of this package. When it cannot be imported,
+`NUMEXPR_AVAILABLE` is False and the public functions fall back to their NumPy implementations.
+They also fall back to NumPy whenever `use_numexpr` does not expect an expression to be faster,
+since the SIMD ufunc loops of NumPy outrun a single numexpr thread on most of these formulas.
+
+Floating point literals in numexpr expressions are always double precision, so the expressions
+only contain integer literals and every other constant is bound in the dtype being computed in.
+"""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from ._constants import DEG_TO_RAD, RAD_TO_DEG, HOUR_TO_RAD
+from ._dispatch import is_ndarray_or_scalar
+from ._sincos import sincos
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    ne = None
+    NUMEXPR_AVAILABLE = False
+
+# smallest input for which a blocked evaluation beats the NumPy ufuncs, below which the call overhead dominates
+NUMEXPR_MIN_SIZE = 2048
+
+def use_numexpr(dtype: np.dtype, *values, min_threads: int = 2) -> bool:
+    """
+    Check whether a numexpr expression is expected to be faster than the NumPy implementation for these inputs.
+    The expressions are only used for float64 NumPy arrays and scalars with at least `NUMEXPR_MIN_SIZE` elements,
+    when numexpr runs at least `min_threads` threads. Each caller passes the thread count at which its expression
+    was measured to overtake NumPy.
+    """
+    if not NUMEXPR_AVAILABLE or np.dtype(dtype) != np.float64 or not is_ndarray_or_scalar(*values):
+        return False
+
+    if max(np.size(value) for value in values) < NUMEXPR_MIN_SIZE:
+        return False
+
+    return ne.get_num_threads() >= min_threads
+
+def _constants(dtype: np.dtype) -> dict:
+    return {
+        "DEG_TO_RAD": dtype.type(DEG_TO_RAD),
+        "RAD_TO_DEG": dtype.type(RAD_TO_DEG),
+        "HOUR_TO_RAD": dtype.type(HOUR_TO_RAD),
+        "PI": dtype.type(np.pi)
+    }
+
+def _coefficients(coefficients: Tuple[float, ...], dtype: np.dtype) -> dict:
+    return dict(zip(("A0", "A1", "A2", "A3", "B0", "B1", "B2"), (dtype.type(coefficient) for coefficient in coefficients)))
+
+# polynomial in the cosine `c` and sine `s` of the day angle, evaluated with Horner's rule
+_SOLAR_DEC_EXPRESSION = "((A3 * c + A2) * c + A1) * c + A0 + s * ((B2 * c + B1) * c + B0)"
+
+_SZA_DEG_EXPRESSION = (
+    "arccos("
+    "sin(lat * DEG_TO_RAD) * sin(dec * DEG_TO_RAD) "
+    "+ cos(lat * DEG_TO_RAD) * cos(dec * DEG_TO_RAD) * cos(hour * HOUR_TO_RAD - PI)"
+    ") * RAD_TO_DEG"
+)
+
+_SOLAR_AZIMUTH_DEG_EXPRESSION = (
+    "arcsin(-sin(hour * HOUR_TO_RAD - PI) * cos(dec * DEG_TO_RAD) / sin(SZA * DEG_TO_RAD)) * RAD_TO_DEG"
+)
+
+_SOLAR_AZIMUTH_FROM_LAT_DEG_EXPRESSION = (
+    "arctan2("
+    "-sin(hour * HOUR_TO_RAD - PI) * cos(dec * DEG_TO_RAD), "
+    "cos(hour * HOUR_TO_RAD - PI) * cos(dec * DEG_TO_RAD) * sin(lat * DEG_TO_RAD) - sin(dec * DEG_TO_RAD) * cos(lat * DEG_TO_RAD)"
+    ") * RAD_TO_DEG"
+)
+
+_SUNRISE_COS_EXPRESSION = "-tan(lat * DEG_TO_RAD) * tan_dec"
+
+_SHA_DEG_EXPRESSION = "where(sunrise_cos >= 1, 0, where(sunrise_cos <= -1, 180, arccos(sunrise_cos) * RAD_TO_DEG))"
+
+def _solar_dec_numexpr(day_angle_rad: np.ndarray, coefficients: tuple, dtype: np.dtype, out: Optional[np.ndarray] = None) -> np.ndarray:
+    s, c = sincos(day_angle_rad)
+
+    return ne.evaluate(_SOLAR_DEC_EXPRESSION, local_dict={
+        "c": c,
+        "s": s,
+        **_coefficients(coefficients, dtype)
+    }, out=out)
+
+def _SZA_deg_numexpr(latitude: np.ndarray, solar_dec_deg: np.ndarray, hour: np.ndarray, dtype: np.dtype, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return ne.evaluate(_SZA_DEG_EXPRESSION, local_dict={
+        "lat": latitude,
+        "dec": solar_dec_deg,
+        "hour": hour,
+        **_constants(dtype)
+    }, out=out)
+
+def _solar_azimuth_deg_numexpr(solar_dec_deg: np.ndarray, SZA_deg: np.ndarray, hour: np.ndarray, dtype: np.dtype, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return ne.evaluate(_SOLAR_AZIMUTH_DEG_EXPRESSION, local_dict={
+        "dec": solar_dec_deg,
+        "SZA": SZA_deg,
+        "hour": hour,
+        **_constants(dtype)
+    }, out=out)
+
+def _solar_azimuth_from_lat_deg_numexpr(solar_dec_deg: np.ndarray, latitude: np.ndarray, hour: np.ndarray, dtype: np.dtype, out: Optional[np.ndarray] = None) -> np.ndarray:
+    return ne.evaluate(_SOLAR_AZIMUTH_FROM_LAT_DEG_EXPRESSION, local_dict={
+        "dec": solar_dec_deg,
+        "lat": latitude,
+        "hour": hour,
+        **_constants(dtype)
+    }, out=out)
+
+def _SHA_deg_numexpr(tan_dec: np.ndarray, latitude: np.ndarray, dtype: np.dtype, out: Optional[np.ndarray] = None) -> np.ndarray:
+    sunrise_cos = ne.evaluate(_SUNRISE_COS_EXPRESSION, local_dict={
+        "lat": latitude,
+        "tan_dec": tan_dec,
+        **_constants(dtype)
+    })
+
+    return ne.evaluate(_SHA_DEG_EXPRESSION, local_dict={
+        "sunrise_cos": sunrise_cos,
+        **_constants(dtype)
+    }, out=out)
@@ -0,0 +1,96 @@
+"""
+Pure-Python scalar implementations of the solar angle formulas.
+
+The `math` functions avoid the ufunc machinery, which dominates the cost of evaluating
+these formulas one point at a time. Out-of-domain inverse cosines and sines return NaN
+like their NumPy counterparts instead of raising.
+"""
+from math import sin, cos, tan, acos, asin, atan2, pi, nan
+
+from ._constants import DEG_TO_RAD, RAD_TO_DEG, HOUR_TO_RAD, DAY_TO_RAD, DEC_POLYNOMIAL_RAD
+
+def _acos(x: float) -> float:
+    return acos(x) if -1.0 <= x <= 1.0 else nan
+
+def _asin(x: float) -> float:
+    return asin(x) if -1.0 <= x <= 1.0 else nan
+
+def _solar_dec_scalar(day_angle_rad: float, coefficients: tuple = DEC_POLYNOMIAL_RAD) -> float:
+    A0, A1, A2, A3, B0, B1, B2 = coefficients
+    c = cos(day_angle_rad)
+    s = sin(day_angle_rad)
+
+    return ((A3 * c + A2) * c + A1) * c + A0 + s * ((B2 * c + B1) * c + B0)
+
+def _SZA_deg_scalar(latitude: float, solar_dec_deg: float, hour: float) -> float:
+    latitude_rad = latitude * DEG_TO_RAD
+    solar_dec_rad = solar_dec_deg * DEG_TO_RAD
+    hour_angle_rad = hour * HOUR_TO_RAD - pi
+
+    return _acos(sin(latitude_rad) * sin(solar_dec_rad) + cos(latitude_rad) * cos(solar_dec_rad) * cos(hour_angle_rad)) * RAD_TO_DEG
+
+def _SZA_deg_from_DOY_scalar(latitude: float, DOY: float, hour: float) -> float:
+    latitude_rad = latitude * DEG_TO_RAD
+    solar_dec_rad = _solar_dec_scalar(DOY * DAY_TO_RAD - DAY_TO_RAD)
+    hour_angle_rad = hour * HOUR_TO_RAD - pi
+
+    return _acos(sin(latitude_rad) * sin(solar_dec_rad) + cos(latitude_rad) * cos(solar_dec_rad) * cos(hour_angle_rad)) * RAD_TO_DEG
+
+def _SHA_deg_scalar(DOY: float, latitude: float) -> float:
+    day_angle_rad = DOY * DAY_TO_RAD - DAY_TO_RAD
+    sunrise_cos = -tan(latitude * DEG_TO_RAD) * tan(_solar_dec_scalar(day_angle_rad))
+
+    # apply polar correction
+    if sunrise_cos >= 1.0:
+        return 0.0
+    elif sunrise_cos <= -1.0:
+        return 180.0
+    else:
+        return acos(sunrise_cos) * RAD_TO_DEG
+
+def _solar_angles_scalar(DOY: float, latitude: float, hour: float) -> tuple:
+    solar_dec_rad = _solar_dec_scalar(DOY * DAY_TO_RAD - DAY_TO_RAD)
+    latitude_rad = latitude * DEG_TO_RAD
+    hour_angle_rad = hour * HOUR_TO_RAD - pi
+
+    sin_dec = sin(solar_dec_rad)
+    cos_dec = cos(solar_dec_rad)
+    sin_lat = sin(latitude_rad)
+    cos_lat = cos(latitude_rad)
+    sin_hour_angle = sin(hour_angle_rad)
+    cos_hour_angle = cos(hour_angle_rad)
+
+    SZA_deg = _acos(sin_lat * sin_dec + cos_lat * cos_dec * cos_hour_angle) * RAD_TO_DEG
+    sunrise_cos = -sin_lat * sin_dec / (cos_lat * cos_dec)
+
+    # apply polar correction
+    if sunrise_cos >= 1.0:
+        SHA_deg = 0.0
+    elif sunrise_cos <= -1.0:
+        SHA_deg = 180.0
+    else:
+        SHA_deg = acos(sunrise_cos) * RAD_TO_DEG
+
+    solar_azimuth_deg = atan2(-sin_hour_angle * cos_dec, cos_hour_angle * cos_dec * sin_lat - sin_dec * cos_lat) * RAD_TO_DEG
+
+    return SZA_deg, SHA_deg, solar_azimuth_deg, 12.0 - SHA_deg / 15.0, SHA_deg * 2.0 / 15.0
+
+def _solar_azimuth_deg_scalar(solar_dec_deg: float, SZA_deg: float, hour: float) -> float:
+    sin_SZA = sin(SZA_deg * DEG_TO_RAD)
+    hour_angle_rad = hour * HOUR_TO_RAD - pi
+
+    if sin_SZA == 0.0:
+        return nan
+
+    return _asin(-1.0 * sin(hour_angle_rad) * cos(solar_dec_deg * DEG_TO_RAD) / sin_SZA) * RAD_TO_DEG
+
+def _solar_azimuth_deg_from_lat_scalar(solar_dec_deg: float, latitude: float, hour: float) -> float:
+    solar_dec_rad = solar_dec_deg * DEG_TO_RAD
+    latitude_rad = latitude * DEG_TO_RAD
+    hour_angle_rad = hour * HOUR_TO_RAD - pi
+    cos_dec = cos(solar_dec_rad)
+
+    return atan2(
+        -sin(hour_angle_rad) * cos_dec,
+        cos(hour_angle_rad) * cos_dec * sin(latitude_rad) - sin(solar_dec_rad) * cos(latitude_rad)
+    ) * RAD_TO_DEG
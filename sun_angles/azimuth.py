@@ -1,20 +1,130 @@
 import warnings
+from typing import Optional, Union
+
 import numpy as np
 
-def calculate_solar_azimuth(solar_dec_deg: np.ndarray, SZA_deg: np.ndarray, hour: np.ndarray) -> np.ndarray:
+from ._constants import DEG_TO_RAD, RAD_TO_DEG
+from ._dispatch import astype_floating, floating_dtype, get_array_module, is_scalar
+from ._numba_kernels import NUMBA_AVAILABLE, use_numba
+from ._numexpr_kernels import NUMEXPR_AVAILABLE, use_numexpr
+from ._scalar import _solar_azimuth_deg_scalar, _solar_azimuth_deg_from_lat_scalar
+from ._sincos import sincos
+from .hour_angle import hour_angle_rad_from_hour
+
+if NUMBA_AVAILABLE:
+    from ._numba_kernels import _azimuth_kernel, _azimuth_from_lat_kernel, run_kernel
+
+if NUMEXPR_AVAILABLE:
+    from ._numexpr_kernels import _solar_azimuth_deg_numexpr, _solar_azimuth_from_lat_deg_numexpr
+
+__all__ = ["solar_azimuth_deg_from_lat_dec_hour", "calculate_solar_azimuth"]
+
+def _solar_azimuth_rad_from_trig(
+        sin_dec: np.ndarray,
+        cos_dec: np.ndarray,
+        sin_hour_angle: np.ndarray,
+        cos_hour_angle: np.ndarray,
+        sin_lat: np.ndarray,
+        cos_lat: np.ndarray,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate the solar azimuth in radians from the already computed sines and cosines of the solar declination,
+    hour angle, and latitude, using the quadrant-safe arctangent.
+    The azimuth is measured from south, positive toward east before solar noon and negative toward west after.
+    """
+    xp = get_array_module(sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, sin_lat, cos_lat)
+
+    return xp.arctan2(-sin_hour_angle * cos_dec, cos_hour_angle * cos_dec * sin_lat - sin_dec * cos_lat, out=out)
+
+def solar_azimuth_deg_from_lat_dec_hour(
+        latitude: np.ndarray,
+        solar_dec_deg: np.ndarray,
+        hour: np.ndarray,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    r"""
+    Calculate the solar azimuth angle in degrees from the latitude, solar declination, and hour of the day.
+
+    Parameters:
+    latitude (np.ndarray): Latitude in degrees.
+    solar_dec_deg (np.ndarray): Solar declination in degrees.
+    hour (np.ndarray): Solar time in hours, where 12 corresponds to solar noon.
+    dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 when the array inputs are float32 and float64 otherwise.
+    out (np.ndarray, optional): Array to write the result into, with the broadcast shape of the inputs.
+
+    Returns:
+    np.ndarray: Solar azimuth angle in degrees, measured from south, positive toward east before solar noon
+    and negative toward west after.
+
+    The calculation is based on the formula:
+    $$ \text{solar_azimuth_rad} = \arctan2\left(-\sin(\text{hour_angle_rad}) \cos(\text{solar_dec_rad}),
+       \cos(\text{hour_angle_rad}) \cos(\text{solar_dec_rad}) \sin(\text{latitude_rad}) - \sin(\text{solar_dec_rad}) \cos(\text{latitude_rad})\right) $$
+    which is correct in all four quadrants and does not need the solar zenith angle,
+    unlike the arcsine of `calculate_solar_azimuth`, which only covers azimuths within 90 degrees of south.
     """
+    # evaluate scalars with the `math` module to avoid ufunc dispatch overhead
+    if out is None and is_scalar(solar_dec_deg, latitude, hour):
+        return _solar_azimuth_deg_from_lat_scalar(solar_dec_deg, latitude, hour)
+
+    # preserve float32 inputs instead of promoting them to float64
+    if dtype is None:
+        dtype = floating_dtype(solar_dec_deg, latitude, hour) if out is None else out.dtype
+
+    solar_dec_deg = astype_floating(solar_dec_deg, dtype)
+    latitude = astype_floating(latitude, dtype)
+    hour = astype_floating(hour, dtype)
+
+    # when Numba is installed and enough threads share the loop, compute NumPy arrays in a single compiled loop,
+    # evaluating the declination and hour angle terms at their own shapes instead of once per pixel
+    if use_numba(dtype, solar_dec_deg, latitude, hour, min_threads=2):
+        sin_dec, cos_dec = sincos(solar_dec_deg * DEG_TO_RAD)
+        sin_hour_angle, cos_hour_angle = sincos(hour_angle_rad_from_hour(hour))
+
+        return run_kernel(_azimuth_from_lat_kernel, latitude, sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, dtype=dtype, out=out)
+
+    # otherwise when numexpr is installed and enough threads share the blocks, evaluate the whole formula in a single blocked pass
+    if use_numexpr(dtype, solar_dec_deg, latitude, hour, min_threads=2):
+        return _solar_azimuth_from_lat_deg_numexpr(solar_dec_deg, latitude, hour, dtype, out)
+
+    sin_dec, cos_dec = sincos(solar_dec_deg * DEG_TO_RAD)
+    sin_hour_angle, cos_hour_angle = sincos(hour_angle_rad_from_hour(hour))
+    sin_lat, cos_lat = sincos(latitude * DEG_TO_RAD)
+
+    solar_azimuth_deg = _solar_azimuth_rad_from_trig(sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, sin_lat, cos_lat, out=out)
+    solar_azimuth_deg *= RAD_TO_DEG
+
+    return solar_azimuth_deg
+
+def calculate_solar_azimuth(
+        solar_dec_deg: np.ndarray,
+        SZA_deg: Union[np.ndarray, None],
+        hour: np.ndarray,
+        latitude: Optional[np.ndarray] = None,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    r"""
     Calculate the solar azimuth angle based on the solar declination, solar zenith angle, and hour of the day.
     
     Parameters:
     solar_dec_deg (np.ndarray): Solar declination in degrees.
-    SZA_deg (np.ndarray): Solar zenith angle in degrees.
+    SZA_deg (np.ndarray): Solar zenith angle in degrees, which may be None when `latitude` is given.
     hour (np.ndarray): Hour of the day, where 0 corresponds to 00:00 and 23 corresponds to 23:00.
+    latitude (np.ndarray, optional): Latitude in degrees. When given, the quadrant-safe formula below is used instead
+        and `SZA_deg` is not needed, which is the same as calling `solar_azimuth_deg_from_lat_dec_hour`.
+    dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 when the array inputs are float32 and float64 otherwise.
+    out (np.ndarray, optional): Array to write the result into, with the broadcast shape of the inputs.
     
     Returns:
     np.ndarray: Solar azimuth angle in degrees.
     
     The calculation is based on the formula:
     $$ \text{solar_azimuth_rad} = \arcsin\left(-1.0 \times \sin(\text{hour_angle_rad}) \times \cos(\text{solar_dec_rad}) / \sin(\text{SZA_rad})\right) $$
+
+    The arcsine only covers azimuths within 90 degrees of south. When the latitude is given, the azimuth is calculated with
+    $$ \text{solar_azimuth_rad} = \arctan2\left(-\sin(\text{hour_angle_rad}) \cos(\text{solar_dec_rad}),
+       \cos(\text{hour_angle_rad}) \cos(\text{solar_dec_rad}) \sin(\text{latitude_rad}) - \sin(\text{solar_dec_rad}) \cos(\text{latitude_rad})\right) $$
+    which is correct in all four quadrants and does not need the solar zenith angle.
+    In both cases the azimuth is measured from south, positive toward east before solar noon and negative toward west after.
     
     Note:
     This function ignores any warnings that might be generated during the calculations.
@@ -22,21 +132,52 @@ def calculate_solar_azimuth(solar_dec_deg: np.ndarray, SZA_deg: np.ndarray, hour
     References:
     Muneer, T., & Fairooz, F. (2005). Solar radiation and daylight models: for the energy efficient design of buildings. Architectural Press.
     """
+    if latitude is not None:
+        return solar_azimuth_deg_from_lat_dec_hour(latitude, solar_dec_deg, hour, dtype=dtype, out=out)
+
+    if SZA_deg is None:
+        raise ValueError("either the solar zenith angle or the latitude is required to calculate the solar azimuth")
+
+    # evaluate scalars with the `math` module to avoid ufunc dispatch overhead
+    if out is None and is_scalar(solar_dec_deg, SZA_deg, hour):
+        return _solar_azimuth_deg_scalar(solar_dec_deg, SZA_deg, hour)
+
+    # preserve float32 inputs instead of promoting them to float64
+    if dtype is None:
+        dtype = floating_dtype(solar_dec_deg, SZA_deg, hour) if out is None else out.dtype
+
+    solar_dec_deg = astype_floating(solar_dec_deg, dtype)
+    SZA_deg = astype_floating(SZA_deg, dtype)
+    hour = astype_floating(hour, dtype)
+
+    # when Numba is installed and enough threads share the loop, compute NumPy arrays in a single compiled loop,
+    # evaluating the declination and hour angle terms at their own shapes instead of once per pixel
+    if use_numba(dtype, solar_dec_deg, SZA_deg, hour, min_threads=2):
+        cos_dec = np.cos(solar_dec_deg * DEG_TO_RAD)
+        sin_hour_angle = np.sin(hour_angle_rad_from_hour(hour))
+
+        return run_kernel(_azimuth_kernel, cos_dec, sin_hour_angle, SZA_deg, dtype=dtype, out=out)
+
+    # otherwise when numexpr is installed and enough threads share the blocks, evaluate the whole formula in a single blocked pass
+    if use_numexpr(dtype, solar_dec_deg, SZA_deg, hour, min_threads=2):
+        return _solar_azimuth_deg_numexpr(solar_dec_deg, SZA_deg, hour, dtype, out)
+
+    # get the array namespace of the inputs, which runs the calculation on the GPU for CuPy arrays
+    xp = get_array_module(solar_dec_deg, SZA_deg, hour)
+
     with warnings.catch_warnings():
         # Ignore warnings that might be generated during the calculations
         warnings.filterwarnings('ignore')
         
         # Convert the solar declination from degrees to radians
-        solar_dec_rad = np.radians(solar_dec_deg)
+        solar_dec_rad = solar_dec_deg * DEG_TO_RAD
         # Convert the solar zenith angle from degrees to radians
-        SZA_rad = np.radians(SZA_deg)
-        # Calculate the hour angle in degrees and convert it to radians
-        hour_angle_deg = hour * 15.0 - 180.0
-        # convert hour angle to radians
-        hour_angle_rad = np.radians(hour_angle_deg)
+        SZA_rad = SZA_deg * DEG_TO_RAD
+        # Calculate the hour angle in radians from hour * 15 - 180 degrees in a single multiply-subtract
+        hour_angle_rad = hour_angle_rad_from_hour(hour)
         # Calculate the solar azimuth in radians using the formula provided in the docstring
-        solar_azimuth_rad = np.arcsin(-1.0 * np.sin(hour_angle_rad) * np.cos(solar_dec_rad) / np.sin(SZA_rad))
-        # Convert the solar azimuth from radians to degrees
-        solar_azimuth_deg = np.degrees(solar_azimuth_rad)
+        solar_azimuth_deg = xp.arcsin(-1.0 * xp.sin(hour_angle_rad) * xp.cos(solar_dec_rad) / xp.sin(SZA_rad), out=out)
+        # Convert the solar azimuth from radians to degrees in place
+        solar_azimuth_deg *= RAD_TO_DEG
     
     return solar_azimuth_deg
@@ -1,11 +1,23 @@
+from typing import Optional
+
 import numpy as np
 
-def day_angle_rad_from_DOY(DOY: np.ndarray) -> np.ndarray:
+from ._constants import DAY_TO_RAD
+from ._dispatch import astype_floating, floating_dtype, get_array_module
+
+__all__ = ["day_angle_rad_from_DOY"]
+
+def day_angle_rad_from_DOY(
+        DOY: np.ndarray,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Calculate the day angle in radians from the day of the year.
 
     Parameters:
     DOY (np.ndarray): A numpy array containing day of the year values (integers between 1 and 365).
+    dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 for float32 input and float64 otherwise.
+    out (np.ndarray, optional): Array to write the result into, with the broadcast shape of the inputs.
 
     Returns:
     np.ndarray: A numpy array containing the corresponding day angles in radians.
@@ -16,8 +28,19 @@ def day_angle_rad_from_DOY(DOY: np.ndarray) -> np.ndarray:
     This formula converts the day of the year into an angle in radians, 
     with 0 radians representing the start of the year (DOY=1) and 
     2π radians representing the end of the year (DOY=365).
+    It is evaluated as DOY * (2π / 365) - (2π / 365) with the constant precomputed.
 
     Reference:
     Duffie, J. A., & Beckman, W. A. (2013). Solar Engineering of Thermal Processes (4th ed.). Wiley.
     """
-    return (2 * np.pi * (DOY - 1)) / 365
+    if dtype is None:
+        dtype = floating_dtype(DOY) if out is None else out.dtype
+
+    DOY = astype_floating(DOY, dtype)
+    xp = get_array_module(DOY)
+
+    # scale into the output and offset it in place, instead of subtracting, multiplying, and dividing
+    day_angle_rad = xp.multiply(DOY, DAY_TO_RAD, out=out)
+    day_angle_rad -= DAY_TO_RAD
+
+    return day_angle_rad
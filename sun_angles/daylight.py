@@ -1,6 +1,10 @@
+from typing import Optional
+
 import numpy as np
 
-def daylight_from_SHA(SHA_deg: np.ndarray) -> np.ndarray:
+__all__ = ["daylight_from_SHA"]
+
+def daylight_from_SHA(SHA_deg: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     This function calculates daylight hours from the sunrise hour angle (SHA) in degrees.
     
@@ -18,6 +22,8 @@ def daylight_from_SHA(SHA_deg: np.ndarray) -> np.ndarray:
     ----------
     SHA_deg : np.ndarray
         Sunrise hour angle in degrees. Must be a numpy array.
+    out : np.ndarray, optional
+        Array to write the daylight hours into, with the shape of `SHA_deg`.
         
     Returns
     -------
@@ -29,4 +35,4 @@ def daylight_from_SHA(SHA_deg: np.ndarray) -> np.ndarray:
     - Allen, R.G., Pereira, L.S., Raes, D., Smith, M., 1998. Crop evapotranspiration-Guidelines for computing crop water requirements-FAO Irrigation and drainage paper 56. FAO, Rome, 300(9).
     - Duffie, J. A., & Beckman, W. A. (2013). Solar Engineering of Thermal Processes (4th ed.). Wiley.
     """
-    return (2.0 / 15.0) * SHA_deg
+    return np.multiply(SHA_deg, 2.0 / 15.0, out=out)
@@ -1,11 +1,145 @@
+from numbers import Integral
+from typing import Optional
+
 import numpy as np
 
-def solar_dec_deg_from_day_angle_rad(day_angle_rad: np.ndarray) -> np.ndarray:
+from ._constants import DEC_POLYNOMIAL_DEG, DEC_POLYNOMIAL_RAD
+from ._dispatch import astype_floating, floating_dtype, get_array_module, is_scalar
+from ._numba_kernels import NUMBA_AVAILABLE, use_numba
+from ._numexpr_kernels import NUMEXPR_AVAILABLE, use_numexpr
+from ._scalar import _solar_dec_scalar
+from .day_angle import day_angle_rad_from_DOY
+
+if NUMBA_AVAILABLE:
+    from ._numba_kernels import _solar_dec_kernel, run_kernel
+
+if NUMEXPR_AVAILABLE:
+    from ._numexpr_kernels import _solar_dec_numexpr
+
+__all__ = ["solar_dec_deg_from_day_angle_rad", "solar_dec_deg_from_DOY"]
+
+def _solar_dec_from_day_angle_rad(
+        day_angle_rad: np.ndarray,
+        coefficients: tuple,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Evaluate the solar declination series for the given day angle in radians,
+    in whichever angular unit the polynomial coefficients are expressed in.
+    """
+    A0, A1, A2, A3, B0, B1, B2 = coefficients
+
+    xp = get_array_module(day_angle_rad)
+
+    # evaluate the only two transcendental terms, the series being a polynomial in both of them
+    c = xp.cos(day_angle_rad)
+    s = xp.sin(day_angle_rad)
+
+    # accumulate the cosine polynomial with Horner's rule into the output
+    solar_dec = xp.multiply(c, A3, out=out)
+    solar_dec += A2
+    solar_dec *= c
+    solar_dec += A1
+    solar_dec *= c
+    solar_dec += A0
+
+    # accumulate the sine polynomial with Horner's rule into a single temporary
+    sine_terms = c * B2
+    sine_terms += B1
+    sine_terms *= c
+    sine_terms += B0
+    sine_terms *= s
+    solar_dec += sine_terms
+
+    return solar_dec
+
+def _solar_dec(
+        day_angle_rad: np.ndarray,
+        coefficients: tuple,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate solar declination from the day angle in radians, in whichever angular unit the coefficients
+    are expressed in, choosing the implementation the same way for radians and degrees.
+    """
+    # evaluate scalars with the `math` module to avoid ufunc dispatch overhead
+    if out is None and is_scalar(day_angle_rad):
+        return _solar_dec_scalar(day_angle_rad, coefficients)
+
+    if dtype is None:
+        dtype = floating_dtype(day_angle_rad) if out is None else out.dtype
+
+    day_angle_rad = astype_floating(day_angle_rad, dtype)
+
+    # when Numba is installed, compute NumPy arrays in a single compiled loop,
+    # which outruns the sweeps of the NumPy series even on a single thread
+    if use_numba(dtype, day_angle_rad, min_threads=1):
+        return run_kernel(_solar_dec_kernel, day_angle_rad, dtype=dtype, out=out, constants=coefficients)
+
+    # otherwise when numexpr is installed, evaluate the series in a single blocked pass,
+    # which also outruns the NumPy sweeps on a single thread
+    if use_numexpr(dtype, day_angle_rad, min_threads=1):
+        return _solar_dec_numexpr(day_angle_rad, coefficients, dtype, out)
+
+    return _solar_dec_from_day_angle_rad(day_angle_rad, coefficients, out)
+
+def _solar_dec_rad_from_day_angle_rad(
+        day_angle_rad: np.ndarray,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate solar declination in radians from the day angle in radians.
+    """
+    return _solar_dec(day_angle_rad, DEC_POLYNOMIAL_RAD, dtype, out)
+
+def _table_solar_dec(DOY, table: np.ndarray, dtype: Optional[np.dtype] = None) -> Optional[np.ndarray]:
+    """
+    Look up the solar declination of an integer scalar or integer NumPy array of days of the year within 1 to 366
+    in one of the precomputed tables, returning None for any other day of year so that the caller can evaluate the series.
+    The range of an array is only checked here, so the caller uses the returned declination instead of checking again.
+    """
+    if isinstance(DOY, Integral):
+        if not 1 <= DOY <= 366:
+            return None
+    elif isinstance(DOY, np.ndarray) and DOY.dtype.kind in "iu" and DOY.size > 0:
+        if DOY.min() < 1 or DOY.max() > 366:
+            return None
+    else:
+        return None
+
+    return table[DOY - 1].astype(floating_dtype(DOY) if dtype is None else dtype, copy=False)
+
+def _solar_dec_rad_from_DOY(DOY: np.ndarray, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """
+    Calculate solar declination in radians from the day of the year.
+
+    Integer days of the year are looked up in the precomputed table.
+    Otherwise large NumPy arrays usually contain only a handful of distinct days of the year,
+    so the series is evaluated once per distinct value and gathered back to the input shape.
+    """
+    solar_dec_rad = _table_solar_dec(DOY, _DEC_TABLE_RAD, dtype)
+
+    if solar_dec_rad is not None:
+        return solar_dec_rad
+
+    if isinstance(DOY, np.ndarray) and DOY.size > 365:
+        unique_DOY, inverse = np.unique(DOY.ravel(), return_inverse=True)
+        unique_solar_dec_rad = _solar_dec_rad_from_day_angle_rad(day_angle_rad_from_DOY(unique_DOY, dtype), dtype)
+
+        return unique_solar_dec_rad[inverse].reshape(DOY.shape)
+
+    return _solar_dec_rad_from_day_angle_rad(day_angle_rad_from_DOY(DOY, dtype), dtype)
+
+def solar_dec_deg_from_day_angle_rad(
+        day_angle_rad: np.ndarray,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Calculate solar declination in degrees from the day angle in radians.
 
     Parameters:
     day_angle_rad (np.ndarray): A numpy array containing day angles in radians.
+    dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 for float32 input and float64 otherwise.
+    out (np.ndarray, optional): Array to write the result into, with the broadcast shape of the inputs.
 
     Returns:
     np.ndarray: A numpy array containing the corresponding solar declination angles in degrees.
@@ -17,10 +151,51 @@ def solar_dec_deg_from_day_angle_rad(day_angle_rad: np.ndarray) -> np.ndarray:
     
     This formula converts the day angle in radians to the solar declination in degrees, 
     which represents the angle between the rays of the sun and the plane of the Earth's equator.
+    The conversion from radians to degrees is folded into the coefficients.
 
     Reference:
     Duffie, J. A., & Beckman, W. A. (2013). Solar Engineering of Thermal Processes (4th ed.). Wiley.
     """
-    return (0.006918 - 0.399912 * np.cos(day_angle_rad) + 0.070257 * np.sin(day_angle_rad) 
-            - 0.006758 * np.cos(2 * day_angle_rad) + 0.000907 * np.sin(2 * day_angle_rad) 
-            - 0.002697 * np.cos(3 * day_angle_rad) + 0.00148 * np.sin(3 * day_angle_rad)) * (180 / np.pi)
+    return _solar_dec(day_angle_rad, DEC_POLYNOMIAL_DEG, dtype, out)
+
+# the solar declination of every integer day of the year, including the leap day,
+# evaluated once with the NumPy implementation at import time
+_DEC_TABLE = _solar_dec_from_day_angle_rad(day_angle_rad_from_DOY(np.arange(1, 367), np.dtype(np.float64)), DEC_POLYNOMIAL_DEG)
+_DEC_TABLE_RAD = _solar_dec_from_day_angle_rad(day_angle_rad_from_DOY(np.arange(1, 367), np.dtype(np.float64)), DEC_POLYNOMIAL_RAD)
+
+def solar_dec_deg_from_DOY(
+        DOY: np.ndarray,
+        dtype: Optional[np.dtype] = None,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate solar declination in degrees from the day of the year.
+
+    Parameters:
+    DOY (np.ndarray): A numpy array containing day of the year values (integers between 1 and 366).
+    dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 for float32 input and float64 otherwise.
+    out (np.ndarray, optional): Array to write the result into, with the shape of `DOY`.
+
+    Returns:
+    np.ndarray: A numpy array containing the corresponding solar declination angles in degrees.
+
+    The declination only depends on the day of the year, so integer days of the year are looked up
+    in a table of the 366 possible values, which is computed once when the module is imported.
+    Other inputs, such as fractional days of the year, are evaluated with
+    `solar_dec_deg_from_day_angle_rad` of `day_angle_rad_from_DOY`.
+    """
+    if dtype is None and out is not None:
+        dtype = out.dtype
+
+    solar_dec_deg = _table_solar_dec(DOY, _DEC_TABLE, dtype)
+
+    if solar_dec_deg is None:
+        return solar_dec_deg_from_day_angle_rad(day_angle_rad_from_DOY(DOY, dtype), dtype, out)
+
+    if out is None and is_scalar(DOY):
+        return float(solar_dec_deg)
+
+    if out is not None:
+        out[...] = solar_dec_deg
+        solar_dec_deg = out
+
+    return solar_dec_deg
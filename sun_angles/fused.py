@@ -0,0 +1,91 @@
+from collections import namedtuple
+from typing import Optional, Union
+
+import numpy as np
+from rasters import Raster
+
+from ._constants import DEG_TO_RAD, RAD_TO_DEG
+from ._dispatch import astype_floating, floating_dtype, get_array_module, is_scalar
+from ._numba_kernels import NUMBA_AVAILABLE, use_numba
+from ._scalar import _solar_angles_scalar
+from ._sincos import sincos
+from .azimuth import _solar_azimuth_rad_from_trig
+from .daylight import daylight_from_SHA
+from .declination import _solar_dec_rad_from_DOY
+from .hour_angle import hour_angle_rad_from_hour
+from .sunrise import sunrise_from_SHA
+
+if NUMBA_AVAILABLE:
+    from ._numba_kernels import _solar_angles_kernel, broadcast_flat
+
+__all__ = ["SolarAngles", "compute_all"]
+
+SolarAngles = namedtuple("SolarAngles", ["SZA_deg", "SHA_deg", "solar_azimuth_deg", "sunrise_hour", "daylight_hours"])
+
+def compute_all(
+        DOY: Union[float, np.ndarray, Raster],
+        lat: Union[float, np.ndarray, Raster],
+        hour: Union[float, np.ndarray, Raster],
+        dtype: Optional[np.dtype] = None) -> SolarAngles:
+    """
+    Calculate the solar zenith angle, sunrise hour angle, solar azimuth, sunrise hour, and daylight hours together,
+    sharing the day angle, the declination, and the sines and cosines of the declination, latitude, and hour angle
+    between them instead of recomputing them for every quantity.
+
+    Parameters:
+    DOY (Union[float, np.ndarray, Raster]): Day of the year (1 to 365).
+    lat (Union[float, np.ndarray, Raster]): Latitude in degrees.
+    hour (Union[float, np.ndarray, Raster]): Solar time in hours, where 12 corresponds to solar noon.
+    dtype (np.dtype, optional): Floating point dtype to compute in. Defaults to float32 when latitude and hour are float32 and float64 otherwise.
+
+    Returns:
+    SolarAngles: A named tuple of `SZA_deg`, `SHA_deg`, `solar_azimuth_deg`, `sunrise_hour`, and `daylight_hours`,
+    with the broadcast shape of the inputs.
+
+    The quantities match those of `calculate_SZA_from_DOY_and_hour`, `SHA_deg_from_DOY_lat`,
+    `solar_azimuth_deg_from_lat_dec_hour`, `sunrise_from_SHA`, and `daylight_from_SHA`.
+    The cosine of the sunrise hour angle, -tan(latitude) * tan(declination), is evaluated as
+    -sin(latitude) * sin(declination) / (cos(latitude) * cos(declination)), reusing the product
+    sin(latitude) * sin(declination) of the solar zenith angle.
+    """
+    # evaluate scalars with the `math` module to avoid ufunc dispatch overhead
+    if is_scalar(DOY, lat, hour):
+        return SolarAngles(*_solar_angles_scalar(DOY, lat, hour))
+
+    # preserve float32 inputs instead of promoting them to float64, regardless of the integer day of year
+    if dtype is None:
+        dtype = floating_dtype(lat, hour)
+
+    lat = astype_floating(lat, dtype)
+    hour = astype_floating(hour, dtype)
+
+    # evaluate the declination and hour angle terms at their own shapes, which are usually a scalar and a time vector,
+    # looking up the declination of integer days of the year instead of evaluating the series
+    sin_dec, cos_dec = sincos(_solar_dec_rad_from_DOY(DOY, dtype))
+    sin_hour_angle, cos_hour_angle = sincos(hour_angle_rad_from_hour(hour))
+
+    # when Numba is installed and enough threads share the loop, compute all five outputs of NumPy arrays in a single compiled loop
+    if use_numba(dtype, lat, sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, min_threads=2):
+        shape, args = broadcast_flat(lat, sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, dtype=dtype)
+        outputs = [np.empty(shape, dtype=dtype) for _ in SolarAngles._fields]
+        _solar_angles_kernel(*args, *(output.ravel() for output in outputs))
+
+        return SolarAngles(*outputs)
+
+    xp = get_array_module(sin_dec, lat, sin_hour_angle)
+
+    sin_lat, cos_lat = sincos(lat * DEG_TO_RAD)
+    sin_lat_sin_dec = sin_lat * sin_dec
+    cos_lat_cos_dec = cos_lat * cos_dec
+
+    SZA_deg = xp.arccos(sin_lat_sin_dec + cos_lat_cos_dec * cos_hour_angle)
+    SZA_deg *= RAD_TO_DEG
+
+    # apply polar correction by clipping the cosine to the domain of the arccosine
+    SHA_deg = xp.arccos(xp.clip(-sin_lat_sin_dec / cos_lat_cos_dec, -1.0, 1.0))
+    SHA_deg *= RAD_TO_DEG
+
+    solar_azimuth_deg = _solar_azimuth_rad_from_trig(sin_dec, cos_dec, sin_hour_angle, cos_hour_angle, sin_lat, cos_lat)
+    solar_azimuth_deg *= RAD_TO_DEG
+
+    return SolarAngles(SZA_deg, SHA_deg, solar_azimuth_deg, sunrise_from_SHA(SHA_deg), daylight_from_SHA(SHA_deg))
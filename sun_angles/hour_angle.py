@@ -0,0 +1,36 @@
+from typing import Optional
+
+import numpy as np
+
+from ._constants import HOUR_TO_RAD
+from ._dispatch import get_array_module
+
+__all__ = ["hour_angle_rad_from_hour"]
+
+def hour_angle_rad_from_hour(hour: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate the hour angle in radians from the solar time in hours.
+
+    Parameters:
+    hour (np.ndarray): A numpy array containing solar time in hours, from 0 to 24.
+    out (np.ndarray, optional): Array to write the result into, with the shape of `hour`.
+
+    Returns:
+    np.ndarray: A numpy array containing the corresponding hour angles in radians.
+
+    The hour angle is calculated using the formula:
+    hour_angle = (hour * 15 - 180) * π / 180
+
+    The conversion from degrees to radians is folded into a single multiply by 15π / 180
+    followed by an in-place subtraction of π, so the hour array is swept once.
+    The hour angle is negative before solar noon and positive after.
+
+    Reference:
+    Duffie, J. A., & Beckman, W. A. (2013). Solar Engineering of Thermal Processes (4th ed.). Wiley.
+    """
+    xp = get_array_module(hour)
+
+    hour_angle_rad = xp.multiply(hour, HOUR_TO_RAD, out=out)
+    hour_angle_rad -= np.pi
+
+    return hour_angle_rad
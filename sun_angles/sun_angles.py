@@ -2,6 +2,8 @@ from .azimuth import *
 from .day_angle import *
 from .daylight import *
 from .declination import *
+from .fused import *
+from .hour_angle import *
 from .SHA import *
 from .sunrise import *
 from .SZA import *
@@ -1,6 +1,10 @@
+from typing import Optional
+
 import numpy as np
 
-def sunrise_from_SHA(SHA_deg: np.ndarray) -> np.ndarray:
+__all__ = ["sunrise_from_SHA"]
+
+def sunrise_from_SHA(SHA_deg: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
     """
     Calculate the sunrise hour from the sunrise hour angle (SHA) in degrees.
 
@@ -10,6 +14,7 @@ def sunrise_from_SHA(SHA_deg: np.ndarray) -> np.ndarray:
 
     Parameters:
     SHA_deg (np.ndarray): Array of sunrise hour angles in degrees.
+    out (np.ndarray, optional): Array to write the sunrise hours into, with the shape of `SHA_deg`.
 
     Returns:
     np.ndarray: Array of calculated sunrise hours.
@@ -26,4 +31,8 @@ def sunrise_from_SHA(SHA_deg: np.ndarray) -> np.ndarray:
     [1] Duffie, J.A., & Beckman, W.A. (2013). Solar Engineering of Thermal Processes. 
     John Wiley & Sons. 
     """
-    return 12.0 - (SHA_deg / 15.0)
+    # divide into the output and offset it in place
+    sunrise = np.divide(SHA_deg, -15.0, out=out)
+    sunrise += 12.0
+
+    return sunrise
@@ -0,0 +1,43 @@
+import pytest
+
+from sun_angles import _numba_kernels, _numexpr_kernels, _sincos, azimuth, declination, fused, SHA, SZA
+from sun_angles._dispatch import is_ndarray_or_scalar
+
+# modules that pick a backend with `use_numba` or `use_numexpr`
+NUMBA_MODULES = [_sincos, azimuth, declination, fused, SHA, SZA]
+NUMEXPR_MODULES = [azimuth, declination, SHA, SZA]
+
+BACKENDS = ["numpy", "numba", "numexpr"]
+
+def _always(dtype, *values, min_threads=1):
+    return is_ndarray_or_scalar(*values)
+
+def _never(dtype, *values, min_threads=1):
+    return False
+
+def force_backend(monkeypatch, backend: str):
+    """
+    Route every public function to a single backend, regardless of the dtype, size, and thread count
+    that `use_numba` and `use_numexpr` normally gate on, so that the kernels run on any machine.
+    """
+    if backend == "numba" and not _numba_kernels.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+
+    if backend == "numexpr" and not _numexpr_kernels.NUMEXPR_AVAILABLE:
+        pytest.skip("numexpr is not installed")
+
+    for module in NUMBA_MODULES:
+        monkeypatch.setattr(module, "use_numba", _always if backend == "numba" else _never)
+
+    for module in NUMEXPR_MODULES:
+        monkeypatch.setattr(module, "use_numexpr", _always if backend == "numexpr" else _never)
+
+@pytest.fixture(params=BACKENDS)
+def backend(request, monkeypatch):
+    force_backend(monkeypatch, request.param)
+
+    return request.param
+
+@pytest.fixture
+def numpy_backend(monkeypatch):
+    force_backend(monkeypatch, "numpy")
@@ -0,0 +1,19 @@
+from datetime import datetime, timezone
+
+import pytest
+
+import sun_angles as sa
+
+def test_calculate_SZA_from_datetime():
+    # 20:00 UTC at 118.2 degrees west is 12:07 solar time, shortly after noon on the June solstice
+    SZA = sa.calculate_SZA_from_datetime(datetime(2024, 6, 20, 20, 0), 34.2, -118.2)
+
+    assert isinstance(SZA, float)
+    assert SZA == pytest.approx(abs(34.2 - sa.solar_dec_deg_from_DOY(172)), abs=0.5)
+
+def test_calculate_SZA_from_datetime_matches_DOY_and_hour():
+    time_UTC = datetime(2024, 3, 1, 17, 30, 36, tzinfo=timezone.utc)
+    lat, lon = 40.0, -105.0
+    hour = 17 + 30 / 60 + 36 / 3600 - 105 / 15
+
+    assert sa.calculate_SZA_from_datetime(time_UTC, lat, lon) == pytest.approx(sa.calculate_SZA_from_DOY_and_hour(lat, lon, 61, hour))
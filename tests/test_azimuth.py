@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import sun_angles as sa
+
+@pytest.mark.parametrize("hour, expected_sign", [(5.0, 1), (19.0, -1)])
+def test_azimuth_beyond_90_degrees_from_south(backend, hour, expected_sign):
+    # at 60 degrees north on the June solstice, the sun rises and sets well north of east and west
+    azimuth = sa.solar_azimuth_deg_from_lat_dec_hour(np.full(4, 60.0), 23.44, hour)
+
+    assert np.all(np.abs(azimuth) > 90.0)
+    assert np.all(np.sign(azimuth) == expected_sign)
+
+def test_azimuth_quadrants(backend):
+    hour = np.array([5.0, 9.0, 12.0, 15.0, 19.0])
+    azimuth = sa.solar_azimuth_deg_from_lat_dec_hour(np.full(5, 60.0), 23.44, hour)
+
+    # east of north, east of south, due south, west of south, and west of north
+    assert 90.0 < azimuth[0] < 180.0
+    assert 0.0 < azimuth[1] < 90.0
+    assert azimuth[2] == pytest.approx(0.0, abs=1e-9)
+    assert -90.0 < azimuth[3] < 0.0
+    assert -180.0 < azimuth[4] < -90.0
+    np.testing.assert_allclose(azimuth[:2], -azimuth[:-3:-1])
+
+def test_azimuth_due_north_at_noon_between_equator_and_subsolar_latitude(backend):
+    azimuth = sa.solar_azimuth_deg_from_lat_dec_hour(np.zeros(3), 23.44, 12.0)
+
+    np.testing.assert_allclose(np.abs(azimuth), 180.0)
+
+def test_azimuth_scalar_matches_arrays(backend):
+    for hour in (5.0, 9.0, 15.0, 19.0):
+        assert sa.solar_azimuth_deg_from_lat_dec_hour(60.0, 23.44, hour) == pytest.approx(sa.solar_azimuth_deg_from_lat_dec_hour(np.array([60.0]), 23.44, hour)[0])
+
+def test_calculate_solar_azimuth_with_latitude(backend):
+    latitude = np.linspace(-60.0, 60.0, 5)
+    expected = sa.solar_azimuth_deg_from_lat_dec_hour(latitude, 20.0, 9.0)
+
+    np.testing.assert_array_equal(sa.calculate_solar_azimuth(20.0, None, 9.0, latitude=latitude), expected)
+
+def test_arcsin_azimuth_matches_arctan2_within_90_degrees_of_south(backend):
+    latitude = np.full(3, 40.0)
+    hour = np.array([10.0, 12.5, 14.0])
+    SZA = sa.SZA_deg_from_lat_dec_hour(latitude, 10.0, hour)
+
+    np.testing.assert_allclose(sa.calculate_solar_azimuth(10.0, SZA, hour), sa.solar_azimuth_deg_from_lat_dec_hour(latitude, 10.0, hour), atol=1e-9)
+
+def test_calculate_solar_azimuth_requires_SZA_or_latitude():
+    with pytest.raises(ValueError):
+        sa.calculate_solar_azimuth(20.0, None, 9.0)
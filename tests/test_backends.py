@@ -0,0 +1,134 @@
+import numpy as np
+import pytest
+
+import sun_angles as sa
+
+SHAPE = (64, 48)
+
+rng = np.random.default_rng(0)
+
+LAT = rng.uniform(-89, 89, SHAPE)
+HOUR = rng.uniform(0, 24, SHAPE)
+DEC = rng.uniform(-23.44, 23.44, SHAPE)
+SZA_DEG = rng.uniform(1, 89, SHAPE)
+DOY = rng.integers(1, 366, SHAPE)
+DAY_ANGLE = rng.uniform(0, 2 * np.pi, SHAPE)
+FRACTIONAL_DOY = DOY + 0.5
+
+# no-data pixels in every floating point input
+for array in (LAT, HOUR, DEC, SZA_DEG, DAY_ANGLE, FRACTIONAL_DOY):
+    array[0, 0] = np.nan
+    array[1, 1] = np.nan
+
+CASES = {
+    "SZA": (sa.SZA_deg_from_lat_dec_hour, (LAT, DEC, HOUR)),
+    "SZA scalar dec hour": (sa.SZA_deg_from_lat_dec_hour, (LAT, 23.0, 10.5)),
+    "SZA from DOY": (lambda lat, DOY, hour, **kwargs: sa.calculate_SZA_from_DOY_and_hour(lat, 0, DOY, hour, **kwargs), (LAT, DOY, HOUR)),
+    "SZA from scalar DOY": (lambda lat, DOY, hour, **kwargs: sa.calculate_SZA_from_DOY_and_hour(lat, 0, DOY, hour, **kwargs), (LAT, 172, HOUR)),
+    "SZA from fractional DOY": (lambda lat, DOY, hour, **kwargs: sa.calculate_SZA_from_DOY_and_hour(lat, 0, DOY, hour, **kwargs), (LAT, FRACTIONAL_DOY, HOUR)),
+    "SHA": (sa.SHA_deg_from_DOY_lat, (DOY, LAT)),
+    "SHA scalar DOY": (sa.SHA_deg_from_DOY_lat, (172, LAT)),
+    "azimuth": (sa.calculate_solar_azimuth, (DEC, SZA_DEG, HOUR)),
+    "azimuth from latitude": (sa.solar_azimuth_deg_from_lat_dec_hour, (LAT, DEC, HOUR)),
+    "declination": (sa.solar_dec_deg_from_day_angle_rad, (DAY_ANGLE,)),
+    "declination from fractional DOY": (sa.solar_dec_deg_from_DOY, (FRACTIONAL_DOY,)),
+}
+
+def _float_args(args, dtype):
+    return tuple(arg.astype(dtype) if isinstance(arg, np.ndarray) and arg.dtype.kind == "f" else arg for arg in args)
+
+def _reference(function, args):
+    """
+    Evaluate the function element by element with its `math` module fast path for Python scalars.
+    """
+    with np.errstate(invalid="ignore"):
+        return np.vectorize(lambda *values: function(*(float(value) if isinstance(value, float) else int(value) for value in values)), otypes=[np.float64])(*args)
+
+@pytest.mark.parametrize("case", CASES)
+def test_backend_matches_scalar_math(backend, case):
+    function, args = CASES[case]
+    result = function(*args)
+
+    assert result.dtype == np.float64
+    np.testing.assert_allclose(result, _reference(function, args), rtol=0, atol=1e-9)
+
+@pytest.mark.parametrize("case", CASES)
+def test_backend_propagates_nan(backend, case):
+    function, args = CASES[case]
+    result = function(*args)
+
+    assert np.isnan(result[0, 0])
+    assert np.isnan(result[1, 1])
+
+@pytest.mark.parametrize("case", CASES)
+def test_backend_preserves_float32(backend, case):
+    function, args = CASES[case]
+    result = function(*_float_args(args, np.float32))
+
+    assert result.dtype == np.float32
+    np.testing.assert_allclose(result, _reference(function, args), rtol=0, atol=2e-2)
+
+@pytest.mark.parametrize("case", CASES)
+def test_backend_writes_into_out(backend, case):
+    function, args = CASES[case]
+    out = np.empty(SHAPE)
+    result = function(*args, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(out, _reference(function, args), rtol=0, atol=1e-9)
+
+def test_backend_writes_into_strided_out(backend):
+    out = np.empty((SHAPE[0], SHAPE[1] * 2))[:, ::2]
+    result = sa.SZA_deg_from_lat_dec_hour(LAT, DEC, HOUR, out=out)
+
+    assert result is out
+    np.testing.assert_allclose(out, _reference(sa.SZA_deg_from_lat_dec_hour, (LAT, DEC, HOUR)), rtol=0, atol=1e-9)
+
+def test_backend_clamps_polar_SHA(backend):
+    latitude = np.array([89.0, -89.0, 0.0, np.nan])
+
+    # polar day in the north and polar night in the south at the June solstice, and 12 hours of daylight at the equator
+    summer = sa.SHA_deg_from_DOY_lat(172, latitude)
+    np.testing.assert_allclose(summer[:3], [180.0, 0.0, 90.0], atol=1e-6)
+    assert np.isnan(summer[3])
+
+    winter = sa.SHA_deg_from_DOY_lat(np.full(4, 355), latitude)
+    np.testing.assert_allclose(winter[:3], [0.0, 180.0, 90.0], atol=1e-6)
+
+    angles = sa.compute_all(172, latitude, np.full(4, 12.0))
+    np.testing.assert_allclose(angles.SHA_deg[:3], [180.0, 0.0, 90.0], atol=1e-6)
+    np.testing.assert_allclose(angles.daylight_hours[:3], [24.0, 0.0, 12.0], atol=1e-6)
+
+@pytest.mark.parametrize("DOY", [172, DOY, FRACTIONAL_DOY], ids=["scalar DOY", "DOY", "fractional DOY"])
+def test_backend_compute_all_matches_separate_functions(backend, DOY):
+    angles = sa.compute_all(DOY, LAT, HOUR)
+    solar_dec_deg = sa.solar_dec_deg_from_DOY(DOY)
+    SHA_deg = _reference(sa.SHA_deg_from_DOY_lat, (DOY, LAT))
+
+    np.testing.assert_allclose(angles.SZA_deg, _reference(sa.SZA_deg_from_lat_dec_hour, (LAT, solar_dec_deg, HOUR)), rtol=0, atol=1e-9)
+    np.testing.assert_allclose(angles.SHA_deg, SHA_deg, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(angles.solar_azimuth_deg, _reference(sa.solar_azimuth_deg_from_lat_dec_hour, (LAT, solar_dec_deg, HOUR)), rtol=0, atol=1e-9)
+    np.testing.assert_allclose(angles.sunrise_hour, sa.sunrise_from_SHA(SHA_deg), rtol=0, atol=1e-9)
+    np.testing.assert_allclose(angles.daylight_hours, sa.daylight_from_SHA(SHA_deg), rtol=0, atol=1e-9)
+
+def test_scalars_return_floats(numpy_backend):
+    assert isinstance(sa.SZA_deg_from_lat_dec_hour(40.0, 10.0, 10.0), float)
+    assert isinstance(sa.SHA_deg_from_DOY_lat(172, 40.0), float)
+    assert isinstance(sa.calculate_solar_azimuth(10.0, 30.0, 10.0), float)
+    assert isinstance(sa.solar_dec_deg_from_DOY(172), float)
+
+def test_lists_are_accepted(numpy_backend):
+    np.testing.assert_allclose(sa.SHA_deg_from_DOY_lat(100, [10.0, 20.0]), [sa.SHA_deg_from_DOY_lat(100, 10.0), sa.SHA_deg_from_DOY_lat(100, 20.0)])
+    np.testing.assert_allclose(sa.SZA_deg_from_lat_dec_hour([10.0, 20.0], 5.0, [9.0, 15.0]), [sa.SZA_deg_from_lat_dec_hour(10.0, 5.0, 9.0), sa.SZA_deg_from_lat_dec_hour(20.0, 5.0, 15.0)])
+
+def test_scalar_inputs_write_into_out(numpy_backend):
+    out = np.empty(())
+    result = sa.SHA_deg_from_DOY_lat(100, 10.0, out=out)
+
+    assert result is out
+    assert out == pytest.approx(sa.SHA_deg_from_DOY_lat(100, 10.0))
+
+def test_integer_DOY_table_matches_series():
+    DOY = np.arange(1, 367)
+
+    np.testing.assert_allclose(sa.solar_dec_deg_from_DOY(DOY), sa.solar_dec_deg_from_day_angle_rad(sa.day_angle_rad_from_DOY(DOY.astype(np.float64))), rtol=0, atol=1e-12)